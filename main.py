@@ -1,4 +1,4 @@
-from src.scanner import Scanner
+from src.scanner import ParallelScanner
 from src.scanner import token_re
 from src.parser import Parser
 import sys
@@ -17,7 +17,7 @@ if __name__ == "__main__":
         print(f"Erro: Arquivo '{file_name}' não encontrado")
         sys.exit(1)
     
-    scanner = Scanner(input_text, token_re)
+    scanner = ParallelScanner(input_text, token_re)
     tokens, lex_errors = scanner.run()
 
     for i in tokens:
@@ -1,4 +1,7 @@
+import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 
 REGEX_LIST = [
     ('COMENTARIO',      r'//.*|/\*[\s\S]*?\*/'),
@@ -63,4 +66,90 @@ class Scanner:
                 })
                 self.id += 1
 
-        return self.tokens, self.errors
\ No newline at end of file
+        return self.tokens, self.errors
+
+PROTEGIDO_REGEX = '|'.join(f'(?:{pattern})' for name, pattern in REGEX_LIST if name in ('COMENTARIO', 'TEXTO'))
+protegido_re = re.compile(PROTEGIDO_REGEX)
+inicio_protegido_re = re.compile(r'[/"\']')
+
+
+def find_protected_spans(input: str):
+    spans = []
+    pos = 0
+    while True:
+        candidate = inicio_protegido_re.search(input, pos)
+        if candidate is None:
+            return spans
+        start = candidate.start()
+        match = protegido_re.match(input, start)
+        if match:
+            spans.append((start, match.end()))
+            pos = match.end()
+        else:
+            pos = start + 1
+
+
+def find_split_points(input: str, chunks: int):
+    spans = find_protected_spans(input)
+    span_starts = [start for start, _ in spans]
+    size = len(input)
+    points = []
+    pos = 0
+    for k in range(1, chunks):
+        pos = max(pos, size * k // chunks)
+        while True:
+            newline = input.find('\n', pos)
+            if newline == -1:
+                return points
+            i = bisect_right(span_starts, newline) - 1
+            if i >= 0 and spans[i][1] > newline:
+                pos = spans[i][1]
+                continue
+            pos = newline + 1
+            break
+        if pos < size and (not points or points[-1] != pos):
+            points.append(pos)
+    return points
+
+
+def _scan_chunk(chunk: str):
+    return Scanner(chunk, token_re).run()
+
+
+class ParallelScanner:
+
+    def __init__(self, input: str, token_regex:re.Pattern[str], workers=None, min_chunk_size=1 << 20):
+        self.input = input
+        self.token_regex = token_regex
+        self.id = 1
+        self.tokens = []
+        self.errors = []
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk_size = min_chunk_size
+
+    def run(self):
+        chunks = min(self.workers, len(self.input) // self.min_chunk_size)
+        if chunks < 2:
+            return Scanner(self.input, self.token_regex).run()
+
+        bounds = [0, *find_split_points(self.input, chunks), len(self.input)]
+        pieces = [self.input[start:end] for start, end in zip(bounds, bounds[1:])]
+        if len(pieces) < 2:
+            return Scanner(self.input, self.token_regex).run()
+
+        with ProcessPoolExecutor(max_workers=len(pieces)) as executor:
+            results = list(executor.map(_scan_chunk, pieces))
+
+        line_offset = 0
+        for piece, (tokens, errors) in zip(pieces, results):
+            for token in tokens:
+                token['id'] = self.id
+                token['linha'] += line_offset
+                self.tokens.append(token)
+                self.id += 1
+            for error in errors:
+                error['linha'] += line_offset
+                self.errors.append(error)
+            line_offset += piece.count('\n')
+
+        return self.tokens, self.errors
@@ -0,0 +1,76 @@
+import random
+import unittest
+
+from src.scanner import ParallelScanner, Scanner, find_split_points, token_re
+
+
+with open('codigo_teste/teste.c', 'r') as file:
+    CODIGO_TESTE = file.read()
+
+FRAGMENTOS = [
+    '"linha um\nlinha dois"',
+    "char c = '\n';\n",
+    '"escape \\\n invalido"\n',
+    '/* nao fechado\n',
+    '"nao fechado\n',
+    "'",
+    '// comentario com "aspas\n',
+    '// comentario com /* dentro\n',
+    'a /= "b";\n',
+    'x/="y"/\'z\'\n',
+    '/* bloco\n com "aspas" e \'\n */\n',
+    '"a\\"b"\n',
+    '0x1F 017 3.14e-2u\n',
+    '@ $ #\n',
+    '   \n\n\t  \n',
+    '\n',
+    'int x = 1;\n',
+]
+
+WORKERS = [2, 3, 5]
+
+
+class ParallelScannerTest(unittest.TestCase):
+
+    def assert_same_as_serial(self, text):
+        expected = Scanner(text, token_re).run()
+        for workers in WORKERS:
+            with self.subTest(workers=workers, text=text[:40]):
+                result = ParallelScanner(text, token_re, workers=workers, min_chunk_size=1).run()
+                self.assertEqual(result, expected)
+
+    def test_empty_input(self):
+        self.assert_same_as_serial('')
+        self.assertEqual(ParallelScanner('', token_re, workers=4, min_chunk_size=1).run(), ([], []))
+
+    def test_codigo_teste(self):
+        self.assert_same_as_serial(CODIGO_TESTE)
+
+    def test_fragments(self):
+        for fragment in FRAGMENTOS:
+            self.assert_same_as_serial(fragment * 5)
+            self.assert_same_as_serial(CODIGO_TESTE + fragment + CODIGO_TESTE)
+
+    def test_comment_at_chunk_edge(self):
+        text = 'int a;\n// fim do chunk\nint b;\n// outro\n"x\ny";\n'
+        for chunks in range(2, 6):
+            for point in find_split_points(text, chunks):
+                self.assertEqual(text[point - 1], '\n')
+        self.assert_same_as_serial(text)
+
+    def test_split_points_outside_protected_spans(self):
+        text = '"um\ndois\ntres"\n/*\n\n\n*/\nint x;\n'
+        for chunks in range(2, 8):
+            for point in find_split_points(text, chunks):
+                self.assertIn(point, {len('"um\ndois\ntres"\n'), len(text) - len('int x;\n')})
+
+    def test_random_inputs(self):
+        rng = random.Random(26)
+        for _ in range(100):
+            parts = [CODIGO_TESTE] + [rng.choice(FRAGMENTOS) for _ in range(rng.randint(0, 40))]
+            rng.shuffle(parts)
+            self.assert_same_as_serial(''.join(parts))
+
+
+if __name__ == '__main__':
+    unittest.main()